@@ -3,39 +3,27 @@
 Handles: StatusElement with 'antifurto' in the name (burglar alarm on/off).
 Uses switchon/switchoff actions on the SideraHome API.
 """
-import logging
-
 from homeassistant.components.alarm_control_panel import (
     AlarmControlPanelEntity,
     AlarmControlPanelEntityFeature,
     AlarmControlPanelState,
 )
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .const import ALARM_KEYWORDS, DOMAIN
-
-_LOGGER = logging.getLogger(__name__)
-
 
-def _is_alarm_element(info: dict) -> bool:
-    """Return True if this StatusElement represents a burglar alarm."""
-    name_lower = (info.get("name") or "").lower()
-    return any(kw in name_lower for kw in ALARM_KEYWORDS)
+from .const import DOMAIN
+from .entity import DomologicaElementEntity, is_alarm_element
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [
+    async_add_entities(
         DomologicaAlarm(coordinator, eid, info)
-        for eid, info in coordinator.element_info.items()
-        if info["class"] == "StatusElement" and _is_alarm_element(info)
-    ]
-    _LOGGER.info("Loading %s alarm control panel entities", len(entities))
-    async_add_entities(entities)
+        for eid, info in coordinator.elements_by_class.get("StatusElement", ())
+        if is_alarm_element(info)
+    )
 
 
-class DomologicaAlarm(CoordinatorEntity, AlarmControlPanelEntity):
+class DomologicaAlarm(DomologicaElementEntity, AlarmControlPanelEntity):
     """Alarm control panel for StatusElement (antifurto on/off)."""
 
     _attr_supported_features = (
@@ -44,36 +32,24 @@ class DomologicaAlarm(CoordinatorEntity, AlarmControlPanelEntity):
     _attr_code_arm_required = False
 
     def __init__(self, coordinator, eid, info):
-        super().__init__(coordinator)
-        self._eid = eid
+        super().__init__(coordinator, eid)
         self._attr_name = info["name"]
+        self._attr_unique_id = f"domologica_{eid}_alarm"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
 
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_alarm"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
-
-    @property
-    def alarm_state(self) -> AlarmControlPanelState | None:
-        data = (self.coordinator.data or {}).get(self._eid)
-        if data is None:
-            return None
-        if data.get("is_on", False):
-            return AlarmControlPanelState.ARMED_AWAY
-        return AlarmControlPanelState.DISARMED
+    def _update_state(self, data: dict) -> None:
+        if not data:
+            self._attr_alarm_state = None
+        elif data.get("is_on", False):
+            self._attr_alarm_state = AlarmControlPanelState.ARMED_AWAY
+        else:
+            self._attr_alarm_state = AlarmControlPanelState.DISARMED
 
     async def async_alarm_disarm(self, code=None) -> None:
         """Send disarm (switchoff) command."""
         await self.coordinator.api_client.async_alarm_command(
             self._eid, arm=False
         )
-        # Optimistic update
-        if self.coordinator.data and self._eid in self.coordinator.data:
-            self.coordinator.data[self._eid]["is_on"] = False
-        self.async_write_ha_state()
         await self.coordinator.async_request_refresh()
 
     async def async_alarm_arm_away(self, code=None) -> None:
@@ -81,8 +57,4 @@ class DomologicaAlarm(CoordinatorEntity, AlarmControlPanelEntity):
         await self.coordinator.api_client.async_alarm_command(
             self._eid, arm=True
         )
-        # Optimistic update
-        if self.coordinator.data and self._eid in self.coordinator.data:
-            self.coordinator.data[self._eid]["is_on"] = True
-        self.async_write_ha_state()
         await self.coordinator.async_request_refresh()
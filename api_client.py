@@ -1,16 +1,19 @@
 """Asynchronous API client for the Domologica system (Master SRL UNA/Vesta)."""
 import asyncio 
 import logging
-import xml.etree.ElementTree as ET 
-from urllib.parse import quote
+import sys
+import threading
+from urllib.parse import quote, urlencode
 
 import aiohttp
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from lxml import etree
 
 from .const import (
     CONNECT_TIMEOUT,
     ELEMENT_CLASS_TO_PLATFORM,
+    EXECUTOR_PARSE_THRESHOLD,
     IGNORED_CLASSES,
     MAX_CONCURRENT_REQUESTS,
     REQUEST_TIMEOUT,
@@ -18,6 +21,65 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_PARSER_LOCAL = threading.local()
+
+# Actions made only of unreserved characters: sent without percent-encoding
+_SAFE_ACTIONS = frozenset({
+    "switchon",
+    "switchoff",
+    "turnup",
+    "turndown",
+    "stop",
+    "simulatepressure",
+    "simulateup",
+    "simulatedown",
+    "Runpwm",
+    "Stoppwm",
+    "setdimmer",
+    "setTMode",
+    "setSeason",
+    "setTMax",
+    "setTMin",
+    "setSpeed",
+    "setseasonwinter",
+    "setseasonsummer",
+    "settemperaturedesired",
+    "settemperaturedesiredH2O",
+})
+
+
+def _xml_parser() -> etree.XMLParser:
+    """Returns the XML parser of the calling thread, creating it on first use.
+
+    lxml parsers are cheap to reuse but must not be shared between threads.
+    """
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        # Strict: a truncated reply must fail rather than parse partially.
+        # No entity expansion or network access, like the stdlib parser
+        parser = etree.XMLParser(
+            huge_tree=False, resolve_entities=False, no_network=True
+        )
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
+def _clean_text(value: str | None) -> str:
+    """Returns the value without surrounding whitespace ("" for None).
+
+    Controller values are usually already trimmed: strip() only runs when
+    the first or last character is whitespace.
+    """
+    if not value:
+        return ""
+    if value[0].isspace() or value[-1].isspace():
+        return value.strip()
+    return value
+
+
+def _parse_xml(body: bytes) -> etree._Element | None:
+    return etree.fromstring(body, parser=_xml_parser())
+
 
 class DomologicaApiClient:
     """Asynchronous HTTP client for communicating with the Vesta control unit."""
@@ -33,25 +95,34 @@ class DomologicaApiClient:
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
-        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-
-    @property
-    def _auth(self) -> aiohttp.BasicAuth:
-        return aiohttp.BasicAuth(self.username, self.password)
-
-    @property
-    def _timeout(self) -> aiohttp.ClientTimeout:
-        return aiohttp.ClientTimeout(
+        self._semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        self._auth = aiohttp.BasicAuth(username, password)
+        self._timeout = aiohttp.ClientTimeout(
             total=REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT
         )
+        self._client_session: aiohttp.ClientSession | None = None
+        # Latest full statuses request, and the same one while not started
+        self._pending_fetch: asyncio.Future[bytes | None] | None = None
+        self._next_fetch: asyncio.Future[bytes | None] | None = None
+        self._fetch_tasks: set[asyncio.Future] = set()
 
     def _session(self) -> aiohttp.ClientSession:
-        return async_get_clientsession(self.hass, verify_ssl=False)
+        # Resolved lazily: the shared session must be fetched inside the loop
+        if self._client_session is None:
+            self._client_session = async_get_clientsession(
+                self.hass, verify_ssl=False
+            )
+        return self._client_session
+
+    @staticmethod
+    def _numeric_id(element_id: str) -> str:
+        """Returns the numeric part of an element path (e.g. "map/12" -> "12")."""
+        return element_id.rpartition("/")[2] or element_id
 
     # ── XML Reading ──────────────────────────────────────────────
 
-    async def async_get_xml(self, endpoint: str) -> ET.Element | None:
-        """Performs a GET request on an endpoint and returns the parsed XML."""
+    async def async_get_raw(self, endpoint: str) -> bytes | None:
+        """Performs a GET request on an endpoint and returns the XML body."""
         url = f"{self.base_url}{endpoint}"
         async with self._semaphore:
             try:
@@ -65,19 +136,31 @@ class DomologicaApiClient:
                     if resp.status != 200:
                         _LOGGER.error("HTTP %s for %s", resp.status, url)
                         return None
-                    content = await resp.text()
-                    if not content or not content.strip().startswith("<"):
+                    body = await resp.read()
+                    if body.lstrip()[:1] != b"<":
                         return None
-                    return ET.fromstring(content)
+                    return body
             except asyncio.TimeoutError:
                 _LOGGER.error("Timeout during request to %s", url)
                 return None
             except aiohttp.ClientError as err:
                 _LOGGER.error("Connection error to %s: %s", url, err)
                 return None
-            except ET.ParseError as err:
-                _LOGGER.error("Invalid XML from %s: %s", url, err)
-                return None
+
+    async def async_get_xml(self, endpoint: str) -> etree._Element | None:
+        """Performs a GET request on an endpoint and returns the parsed XML."""
+        body = await self.async_get_raw(endpoint)
+        if body is None:
+            return None
+        try:
+            if len(body) > EXECUTOR_PARSE_THRESHOLD:
+                return await self.hass.async_add_executor_job(_parse_xml, body)
+            return _parse_xml(body)
+        except etree.XMLSyntaxError as err:
+            _LOGGER.error(
+                "Invalid XML from %s%s: %s", self.base_url, endpoint, err
+            )
+            return None
 
     # ── Connection Test ─────────────────────────────────────────
 
@@ -101,28 +184,46 @@ class DomologicaApiClient:
             return element_info
 
         scene_ids = [
-            s.findtext("id").strip()
-            for s in maps_root.findall(".//MapScene")
-            if s.findtext("id")
+            sid
+            for sid in (
+                _clean_text(s.findtext("id"))
+                for s in maps_root.iter("MapScene")
+            )
+            if sid
         ]
 
-        for sid in scene_ids:
-            scene_root = await self.async_get_xml(f"/api/maps/{sid}.xml")
+        # Scenes are fetched concurrently; the request semaphore keeps the
+        # load on the control unit bounded
+        scene_roots = await asyncio.gather(
+            *(self.async_get_xml(f"/api/maps/{sid}.xml") for sid in scene_ids)
+        )
+
+        log_info = _LOGGER.isEnabledFor(logging.INFO)
+        for scene_root in scene_roots:
             if scene_root is None:
                 continue
 
-            scene_name = scene_root.findtext("name", "").strip()
-
-            for el in scene_root.findall(".//Element"):
-                eid = el.findtext("id")
-                ename = el.findtext("name")
-                eclass = el.findtext("classId")
-
+            # Class and scene names repeat across elements: share one copy
+            scene_name = sys.intern(_clean_text(scene_root.findtext("name")))
+
+            for el in scene_root.iter("Element"):
+                # Single pass over the children instead of three findtext()
+                eid = ename = eclass = None
+                for child in el:
+                    tag = child.tag
+                    if tag == "id":
+                        eid = child.text
+                    elif tag == "name":
+                        ename = child.text
+                    elif tag == "classId":
+                        eclass = child.text
+
+                eid = _clean_text(eid)
+                eclass = _clean_text(eclass)
                 if not eid or not eclass:
                     continue
 
-                eid = eid.strip()
-                eclass = eclass.strip()
+                eclass = sys.intern(eclass)
 
                 if eclass in IGNORED_CLASSES:
                     continue
@@ -134,33 +235,65 @@ class DomologicaApiClient:
                     )
                     continue
 
-                _LOGGER.info(
-                    "Discovered element: id=%s, class=%s, name=%s, scene=%s",
-                    eid, eclass, (ename or "").strip(), scene_name,
-                )
+                ename = _clean_text(ename)
+                if log_info:
+                    _LOGGER.info(
+                        "Discovered element: id=%s, class=%s, name=%s, scene=%s",
+                        eid, eclass, ename, scene_name,
+                    )
                 element_info[eid] = {
-                    "name": (ename or "").strip(),
+                    "name": ename,
                     "class": eclass,
                     "scene": scene_name,
                 }
 
-            # Small pause to avoid stressing the control unit
-            await asyncio.sleep(0.2)
-
         _LOGGER.info("Discovery completed: %s elements found", len(element_info))
-        for eid, info in element_info.items():
-            _LOGGER.info("  -> %s: %s (%s)", eid, info["name"], info["class"])
         return element_info
 
     # ── Polling statuses ────────────────────────────────────────────
 
-    async def async_fetch_all_statuses(self) -> ET.Element | None:
-        """Retrieves the statuses of all elements."""
-        return await self.async_get_xml("/api/element_xml_statuses.xml")
+    async def async_fetch_all_statuses(self) -> bytes | None:
+        """Retrieves the raw statuses of all elements (see parse_all_statuses).
 
-    async def async_fetch_single_status(self, element_id: str) -> ET.Element | None:
+        Concurrent callers share one request, but only a request started
+        after they called: a caller arriving while a fetch is in flight (e.g.
+        right after a command) waits for the next one, shared by everyone
+        arriving meanwhile, so it never gets statuses older than its call.
+        """
+        fetch = self._next_fetch
+        if fetch is None:
+            # Queue a request behind the latest one: callers join it until
+            # it actually starts
+            fetch = self._pending_fetch = self._next_fetch = (
+                self.hass.async_create_background_task(
+                    self._async_fetch_after(self._pending_fetch),
+                    name="domologica_fetch_statuses",
+                )
+            )
+            self._fetch_tasks.add(fetch)
+            fetch.add_done_callback(self._fetch_tasks.discard)
+        # Shielded so that one cancelled caller does not abort the others
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch_after(
+        self, previous: asyncio.Future | None
+    ) -> bytes | None:
+        """Fetches all the statuses once the previous request has completed."""
+        if previous is not None and not previous.done():
+            await asyncio.wait((previous,))
+        # Started: callers arriving from now on queue the next request
+        self._next_fetch = None
+        return await self.async_get_raw("/api/element_xml_statuses.xml")
+
+    def async_cancel_fetches(self) -> None:
+        """Cancels the queued and in-flight status requests (on unload)."""
+        for fetch in self._fetch_tasks:
+            fetch.cancel()
+        self._pending_fetch = self._next_fetch = None
+
+    async def async_fetch_single_status(self, element_id: str) -> etree._Element | None:
         """Retrieves the status of a single element."""
-        numeric_id = element_id.split("/")[-1] if "/" in element_id else element_id
+        numeric_id = self._numeric_id(element_id)
         return await self.async_get_xml(
             f"/api/element_xml_statuses/{numeric_id}.xml"
         )
@@ -184,21 +317,22 @@ class DomologicaApiClient:
         Returns:
             True if the action was successful.
         """
-        numeric_id = element_id.split("/")[-1] if "/" in element_id else element_id
+        numeric_id = self._numeric_id(element_id)
 
         # Build URL with parameters
-        params = f"_method=put&action={quote(action, safe='')}"
+        action_param = (
+            action if action in _SAFE_ACTIONS else quote(action, safe="")
+        )
+        params = f"_method=put&action={action_param}"
 
         if arguments:
+            pairs = []
             for idx, arg in sorted(arguments.items()):
-                arg_val = quote(str(arg["value"]), safe="")
-                arg_type = quote(str(arg.get("type", "int")), safe="")
-                params += (
-                    f"&{quote(f'arguments[{idx}][value]', safe='')}"
-                    f"={arg_val}"
-                    f"&{quote(f'arguments[{idx}][type]', safe='')}"
-                    f"={arg_type}"
+                pairs.append((f"arguments[{idx}][value]", str(arg["value"])))
+                pairs.append(
+                    (f"arguments[{idx}][type]", str(arg.get("type", "int")))
                 )
+            params += "&" + urlencode(pairs, safe="", quote_via=quote)
 
         url = f"{self.base_url}/elements/{numeric_id}?{params}"
 
@@ -214,16 +348,17 @@ class DomologicaApiClient:
                             resp.status, action, element_id,
                         )
                         return False
-                    content = await resp.text()
+                    body = await resp.read()
                     # Response contains <bool>true</bool> if successful
-                    if "<bool>true</bool>" in content:
+                    if b"<bool>true</bool>" in body:
                         return True
                     # Some commands do not return XML but are successful
-                    if content.strip() == "" or resp.status == 200:
+                    if body.strip() == b"" or resp.status == 200:
                         return True
                     _LOGGER.warning(
                         "Unexpected response for %s on %s: %s",
-                        action, element_id, content[:200],
+                        action, element_id,
+                        body[:200].decode("utf-8", "replace"),
                     )
                     return True
             except asyncio.TimeoutError:
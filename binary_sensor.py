@@ -3,65 +3,45 @@
 Handles: StatusElement (system status).
 Alarm-related StatusElements are handled by alarm_control_panel.
 """
-import logging
+import re
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ALARM_KEYWORDS, DOMAIN
+from .const import DOMAIN
+from .entity import DomologicaElementEntity, is_alarm_element
 
-_LOGGER = logging.getLogger(__name__)
-
-
-def _is_alarm_element(info: dict) -> bool:
-    """Return True if this StatusElement represents a burglar alarm."""
-    name_lower = (info.get("name") or "").lower()
-    return any(kw in name_lower for kw in ALARM_KEYWORDS)
+_POWER_RE = re.compile("stato|status")
 
 
 def _guess_device_class(name: str) -> BinarySensorDeviceClass:
     """Deduce device_class from element name."""
-    name_lower = name.lower()
-    if "stato" in name_lower or "status" in name_lower:
+    if _POWER_RE.search(name.lower()):
         return BinarySensorDeviceClass.POWER
     return BinarySensorDeviceClass.PROBLEM
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [
+    async_add_entities(
         DomologicaStatusSensor(coordinator, eid, info)
-        for eid, info in coordinator.element_info.items()
-        if info["class"] == "StatusElement" and not _is_alarm_element(info)
-    ]
-    _LOGGER.info("Loading %s binary sensor entities", len(entities))
-    async_add_entities(entities)
+        for eid, info in coordinator.elements_by_class.get("StatusElement", ())
+        if not is_alarm_element(info)
+    )
 
 
-class DomologicaStatusSensor(CoordinatorEntity, BinarySensorEntity):
+class DomologicaStatusSensor(DomologicaElementEntity, BinarySensorEntity):
     """Binary sensor for StatusElement (status on/off)."""
 
     def __init__(self, coordinator, eid, info):
-        super().__init__(coordinator)
-        self._eid = eid
+        super().__init__(coordinator, eid)
         self._attr_name = info["name"]
         self._attr_device_class = _guess_device_class(info["name"])
+        self._attr_unique_id = f"domologica_{eid}_binary"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
 
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_binary"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
-
-    @property
-    def is_on(self) -> bool | None:
-        data = (self.coordinator.data or {}).get(self._eid)
-        if data is None:
-            return None
-        return data.get("is_on", False)
+    def _update_state(self, data: dict) -> None:
+        self._attr_is_on = data.get("is_on", False) if data else None
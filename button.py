@@ -2,43 +2,32 @@
 
 Handles: SwitchElement (scenarios), UpDownSwitchElement (general blinds command).
 """
-import logging 
-
 from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 
-_LOGGER = logging.getLogger(__name__)
-
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
+    async_add_entities(_iter_buttons(coordinator))
 
-    for eid, info in coordinator.element_info.items():
-        if info["class"] == "SwitchElement":
-            entities.append(
-                DomologicaScenarioButton(
-                    coordinator, eid, info["name"], "simulatepressure",
-                )
-            )
 
-        elif info["class"] == "UpDownSwitchElement":
-            entities.append(
-                DomologicaUpDownButton(
-                    coordinator, eid, f"{info['name']} Up", "simulateup",
-                )
-            )
-            entities.append(
-                DomologicaUpDownButton(
-                    coordinator, eid, f"{info['name']} Down", "simulatedown",
-                )
-            )
+def _iter_buttons(coordinator):
+    """Yield the button entities for the discovered elements."""
+    for eid, info in coordinator.elements_by_class.get("SwitchElement", ()):
+        yield DomologicaScenarioButton(
+            coordinator, eid, info["name"], "simulatepressure",
+        )
 
-    _LOGGER.info("Loading %s button entities", len(entities))
-    async_add_entities(entities)
+    for eid, info in coordinator.elements_by_class.get("UpDownSwitchElement", ()):
+        yield DomologicaUpDownButton(
+            coordinator, eid, f"{info['name']} Up", "simulateup",
+        )
+        yield DomologicaUpDownButton(
+            coordinator, eid, f"{info['name']} Down", "simulatedown",
+        )
 
 
 class DomologicaScenarioButton(CoordinatorEntity, ButtonEntity):
@@ -49,14 +38,8 @@ class DomologicaScenarioButton(CoordinatorEntity, ButtonEntity):
         self._eid = eid
         self._action = action
         self._attr_name = name
-
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_button_{self._action}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
+        self._attr_unique_id = f"domologica_{eid}_button_{action}"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
 
     async def async_press(self) -> None:
         await self.coordinator.api_client.async_button_press(
@@ -75,14 +58,8 @@ class DomologicaUpDownButton(CoordinatorEntity, ButtonEntity):
         self._attr_icon = (
             "mdi:arrow-up-bold" if "up" in action else "mdi:arrow-down-bold"
         )
-
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_button_{self._action}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
+        self._attr_unique_id = f"domologica_{eid}_button_{action}"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
 
     async def async_press(self) -> None:
         await self.coordinator.api_client.async_button_press(
@@ -3,6 +3,8 @@
 Manages: ThermostatElement, ModbusSamsungAir2Element.
 """
 import logging 
+from types import MappingProxyType
+from typing import Final
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -19,17 +21,24 @@ from .const import DOMAIN, THERMOSTAT_PRESET_MAP, THERMOSTAT_PRESET_REVERSE
 _LOGGER = logging.getLogger(__name__)
 
 FAN_MODES = ["auto", "low", "medium", "high"]
+FAN_SPEED_MAP: Final = MappingProxyType(
+    {"auto": 0, "low": 33, "medium": 66, "high": 100}
+)
+
+# fan_mode for every speed 0..100 (<=0 auto, <=33 low, <=66 medium, else high)
+FAN_MODE_BY_SPEED = tuple(
+    "auto" if s <= 0 else "low" if s <= 33 else "medium" if s <= 66 else "high"
+    for s in range(101)
+)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = []
 
-    for eid, info in coordinator.element_info.items():
-        if info["class"] == "ThermostatElement":
-            entities.append(DomologicaThermostat(coordinator, eid, info))
-        elif info["class"] == "ModbusSamsungAir2Element":
-            entities.append(DomologicaSamsungAC(coordinator, eid, info))
+    for eclass, entity_cls in CLIMATE_ENTITY_CLASSES.items():
+        for eid, info in coordinator.elements_by_class.get(eclass, ()):
+            entities.append(entity_cls(coordinator, eid, info))
 
     _LOGGER.info("Loading %s climate entities", len(entities))
     async_add_entities(entities)
@@ -60,18 +69,12 @@ class DomologicaThermostat(CoordinatorEntity, ClimateEntity):
         self._attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL]
         self._attr_preset_modes = ["comfort", "eco", "schedule"]
         self._attr_fan_modes = FAN_MODES
-
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_climate"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
+        self._attr_unique_id = f"domologica_{eid}_climate"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
 
     @property
     def _data(self) -> dict:
-        return (self.coordinator.data or {}).get(self._eid, {})
+        return self.coordinator.element(self._eid)
 
     @property
     def current_temperature(self) -> float | None:
@@ -79,26 +82,27 @@ class DomologicaThermostat(CoordinatorEntity, ClimateEntity):
 
     @property
     def target_temperature(self) -> float | None:
-        season = self._data.get("season", "Winter")
-        if season == "Winter":
-            return self._data.get("t_max")
-        return self._data.get("t_min")
+        d = self._data
+        if d.get("season", "Winter") == "Winter":
+            return d.get("t_max")
+        return d.get("t_min")
 
     @property
     def hvac_mode(self) -> HVACMode:
-        t_mode = self._data.get("t_mode", "Off")
-        if t_mode == "Off":
+        d = self._data
+        if d.get("t_mode", "Off") == "Off":
             return HVACMode.OFF
-        season = self._data.get("season", "Winter")
+        season = d.get("season", "Winter")
         return HVACMode.HEAT if season == "Winter" else HVACMode.COOL
 
     @property
     def hvac_action(self) -> HVACAction:
-        if self.hvac_mode == HVACMode.OFF:
+        d = self._data
+        if d.get("t_mode", "Off") == "Off":
             return HVACAction.OFF
-        if self._data.get("zone_active_winter"):
+        if d.get("zone_active_winter"):
             return HVACAction.HEATING
-        if self._data.get("zone_active_summer"):
+        if d.get("zone_active_summer"):
             return HVACAction.COOLING
         return HVACAction.IDLE
 
@@ -109,23 +113,18 @@ class DomologicaThermostat(CoordinatorEntity, ClimateEntity):
 
     @property
     def fan_mode(self) -> str:
-        speed = self._data.get("speed", 0) or 0
-        if speed <= 0:
-            return "auto"
-        if speed <= 33:
-            return "low"
-        if speed <= 66:
-            return "medium"
-        return "high"
+        speed = self._data.get("speed") or 0
+        return FAN_MODE_BY_SPEED[min(max(speed, 0), 100)]
 
     @property
     def extra_state_attributes(self) -> dict:
+        d = self._data
         return {
-            "season": self._data.get("season"),
-            "t_mode": self._data.get("t_mode"),
-            "delta_t": self._data.get("delta_t"),
-            "reactivity": self._data.get("reactivity"),
-            "calibration": self._data.get("calibration"),
+            "season": d.get("season"),
+            "t_mode": d.get("t_mode"),
+            "delta_t": d.get("delta_t"),
+            "reactivity": d.get("reactivity"),
+            "calibration": d.get("calibration"),
         }
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
@@ -163,8 +162,7 @@ class DomologicaThermostat(CoordinatorEntity, ClimateEntity):
             await self.coordinator.async_request_refresh()
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
-        speed_map = {"auto": 0, "low": 33, "medium": 66, "high": 100}
-        speed = speed_map.get(fan_mode, 0)
+        speed = FAN_SPEED_MAP.get(fan_mode, 0)
         await self.coordinator.api_client.async_thermostat_set_speed(
             self._eid, speed
         )
@@ -174,13 +172,28 @@ class DomologicaThermostat(CoordinatorEntity, ClimateEntity):
 # ── Samsung AC ───────────────────────────────────────────────
 
 # Mapping from hvac_mode HA → Vesta API action
-SAMSUNG_HVAC_ACTIONS = {
+SAMSUNG_HVAC_ACTIONS: Final = MappingProxyType({
     HVACMode.HEAT: "setseasonwinter",
     HVACMode.COOL: "setseasonsummer",
     HVACMode.AUTO: "Set AC unit Mode Auto",
     HVACMode.DRY: "Set AC unit Mode Dry",
     HVACMode.FAN_ONLY: "Set AC unit Mode Fan",
-}
+})
+
+# Mapping from parsed Samsung mode → hvac_mode HA
+SAMSUNG_MODE_TO_HVAC: Final = MappingProxyType({
+    "heat": HVACMode.HEAT,
+    "cool": HVACMode.COOL,
+    "auto": HVACMode.AUTO,
+    "dry": HVACMode.DRY,
+    "fan_only": HVACMode.FAN_ONLY,
+})
+
+# hvac_action HA for the Samsung modes that do not depend on delta_t
+SAMSUNG_MODE_TO_ACTION: Final = MappingProxyType({
+    "dry": HVACAction.DRYING,
+    "fan_only": HVACAction.FAN,
+})
 
 
 class DomologicaSamsungAC(CoordinatorEntity, ClimateEntity):
@@ -210,18 +223,12 @@ class DomologicaSamsungAC(CoordinatorEntity, ClimateEntity):
             HVACMode.FAN_ONLY,
         ]
         self._attr_fan_modes = FAN_MODES
-
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_climate"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
+        self._attr_unique_id = f"domologica_{eid}_climate"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
 
     @property
     def _data(self) -> dict:
-        return (self.coordinator.data or {}).get(self._eid, {})
+        return self.coordinator.element(self._eid)
 
     @property
     def current_temperature(self) -> float | None:
@@ -233,54 +240,39 @@ class DomologicaSamsungAC(CoordinatorEntity, ClimateEntity):
 
     @property
     def hvac_mode(self) -> HVACMode:
-        if not self._data.get("is_on", False):
+        d = self._data
+        if not d.get("is_on", False):
             return HVACMode.OFF
-        mode = self._data.get("mode", "off")
-        mode_map = {
-            "heat": HVACMode.HEAT,
-            "cool": HVACMode.COOL,
-            "auto": HVACMode.AUTO,
-            "dry": HVACMode.DRY,
-            "fan_only": HVACMode.FAN_ONLY,
-        }
-        return mode_map.get(mode, HVACMode.AUTO)
+        return SAMSUNG_MODE_TO_HVAC.get(d.get("mode", "off"), HVACMode.AUTO)
 
     @property
     def hvac_action(self) -> HVACAction:
-        if not self._data.get("is_on", False):
+        d = self._data
+        if not d.get("is_on", False):
             return HVACAction.OFF
-        mode = self._data.get("mode", "off")
-        delta_t = self._data.get("delta_t", 0) or 0
+        mode = d.get("mode", "off")
+        delta_t = d.get("delta_t") or 0
         if mode == "heat":
             return HVACAction.HEATING if delta_t > 0 else HVACAction.IDLE
         if mode == "cool":
             return HVACAction.COOLING if delta_t < 0 else HVACAction.IDLE
-        if mode == "dry":
-            return HVACAction.DRYING
-        if mode == "fan_only":
-            return HVACAction.FAN
-        return HVACAction.IDLE
+        return SAMSUNG_MODE_TO_ACTION.get(mode, HVACAction.IDLE)
 
     @property
     def fan_mode(self) -> str:
-        speed = self._data.get("fan_speed", 0) or 0
-        if speed <= 0:
-            return "auto"
-        if speed <= 33:
-            return "low"
-        if speed <= 66:
-            return "medium"
-        return "high"
+        speed = self._data.get("fan_speed") or 0
+        return FAN_MODE_BY_SPEED[min(max(speed, 0), 100)]
 
     @property
     def extra_state_attributes(self) -> dict:
+        d = self._data
         attrs = {}
-        if self._data.get("error_code"):
-            attrs["error_code"] = self._data["error_code"]
-        if self._data.get("is_connected") is not None:
-            attrs["connected"] = self._data["is_connected"]
-        if self._data.get("delta_t") is not None:
-            attrs["delta_t"] = self._data["delta_t"]
+        if d.get("error_code"):
+            attrs["error_code"] = d["error_code"]
+        if d.get("is_connected") is not None:
+            attrs["connected"] = d["is_connected"]
+        if d.get("delta_t") is not None:
+            attrs["delta_t"] = d["delta_t"]
         return attrs
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
@@ -306,9 +298,15 @@ class DomologicaSamsungAC(CoordinatorEntity, ClimateEntity):
             await self.coordinator.async_request_refresh()
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
-        speed_map = {"auto": 0, "low": 33, "medium": 66, "high": 100}
-        speed = speed_map.get(fan_mode, 0)
+        speed = FAN_SPEED_MAP.get(fan_mode, 0)
         await self.coordinator.api_client.async_samsung_ac_set_fan(
             self._eid, speed
         )
         await self.coordinator.async_request_refresh()
+
+
+# Mapping classId → climate entity class
+CLIMATE_ENTITY_CLASSES: Final = MappingProxyType({
+    "ThermostatElement": DomologicaThermostat,
+    "ModbusSamsungAir2Element": DomologicaSamsungAC,
+})
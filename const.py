@@ -1,4 +1,7 @@
 """Constants for the Domologica UNA Automation integration (Master SRL UNA/Vesta)."""
+import re
+from types import MappingProxyType
+from typing import Final
 
 DOMAIN = "domologica"
 VERSION = "1.0.0"
@@ -7,7 +10,7 @@ MANUFACTURER = "Matteo Pala"
 MODEL = "UNA/Vesta"  
  
 # Type labels for config flow and device registry
-TYPE_LABELS = {
+TYPE_LABELS: Final = MappingProxyType({
     "LightElement": "Light",
     "DimmerableLightLedElement": "Dimmable Light",
     "ShutterElement": "Shutter",
@@ -20,7 +23,7 @@ TYPE_LABELS = {
     "StatusElement": "Status",
     "SwitchElement": "Scenario",
     "UpDownSwitchElement": "Shutter Control",
-}
+})
 
 PLATFORMS = [
     "alarm_control_panel",
@@ -35,19 +38,26 @@ PLATFORMS = [
 ]
 
 # Keywords that identify alarm StatusElements (case-insensitive)
-ALARM_KEYWORDS = {"antifurto", "burglar", "alarm"}
+ALARM_KEYWORDS = frozenset({"antifurto", "burglar", "alarm"})
+ALARM_RE = re.compile("|".join(re.escape(kw.lower()) for kw in ALARM_KEYWORDS))
 
 # HTTP request timeouts
 REQUEST_TIMEOUT = 30
 CONNECT_TIMEOUT = 10
 MAX_CONCURRENT_REQUESTS = 3
 
+# XML payloads larger than this (bytes) are parsed in the executor
+EXECUTOR_PARSE_THRESHOLD = 16384
+
+# Seconds to wait after the last command before reading back the real state
+VERIFY_DELAY = 1.5
+
 # Default configuration
 DEFAULT_POLLING_INTERVAL = 30
 DEFAULT_TRAVEL_TIME = 25
 
 # Mapping classId -> HA platform
-ELEMENT_CLASS_TO_PLATFORM = {
+ELEMENT_CLASS_TO_PLATFORM: Final = MappingProxyType({
     "LightElement": "light",
     "DimmerableLightLedElement": "light",
     "ShutterElement": "cover",
@@ -60,41 +70,43 @@ ELEMENT_CLASS_TO_PLATFORM = {
     "StatusElement": "binary_sensor",
     "SwitchElement": "button",
     "UpDownSwitchElement": "button",
-}
+})
 
 # Classes to completely ignore
-IGNORED_CLASSES = {
+IGNORED_CLASSES = frozenset({
     "WebPageElement",
     "VirtualKeypadElement",
-}
+})
 
 # Light classes
-LIGHT_CLASSES = {"LightElement", "DimmerableLightLedElement"}
-DIMMERABLE_CLASSES = {"DimmerableLightLedElement"}
+LIGHT_CLASSES = frozenset({"LightElement", "DimmerableLightLedElement"})
+DIMMERABLE_CLASSES = frozenset({"DimmerableLightLedElement"})
 
 # Samsung AC Mode mapping (numeric value -> string)
-SAMSUNG_AC_MODE_MAP = {
+SAMSUNG_AC_MODE_MAP: Final = MappingProxyType({
     0: "auto",
     1: "cool",
     2: "dry",
     3: "fan_only",
     4: "heat",
-}
+})
 
 # Water heater operation modes
 WATER_HEATER_MODES = ["eco", "standard", "power", "force"]
-WATER_HEATER_MODE_ACTIONS = {
+WATER_HEATER_MODE_ACTIONS: Final = MappingProxyType({
     "eco": "Set AC Temperature H2O Mode ECO",
     "standard": "Set AC Temperature H2O Mode STANDARD",
     "power": "Set AC Temperature H2O Mode POWER",
     "force": "Set AC Temperature H2O Mode FORCE",
-}
+})
 
 # Thermostat tMode -> HA preset
-THERMOSTAT_PRESET_MAP = {
+THERMOSTAT_PRESET_MAP: Final = MappingProxyType({
     "TMax": "comfort",
     "TMin": "eco",
     "Chrono": "schedule",
     "Off": "off",
-}
-THERMOSTAT_PRESET_REVERSE = {v: k for k, v in THERMOSTAT_PRESET_MAP.items()}
+})
+THERMOSTAT_PRESET_REVERSE: Final = MappingProxyType(
+    {v: k for k, v in THERMOSTAT_PRESET_MAP.items()}
+)
@@ -1,27 +1,51 @@
 """DataUpdateCoordinator for the Domologica UNA Automation integration."""
+import asyncio
 import logging
+from collections import defaultdict
 from datetime import timedelta
+from functools import cached_property
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 ) 
+from lxml import etree
 
 from .api_client import DomologicaApiClient
 from .const import (
     DEFAULT_POLLING_INTERVAL,
     DEFAULT_TRAVEL_TIME,
     DOMAIN,
+    EXECUTOR_PARSE_THRESHOLD,
     INTEGRATION_NAME,
     MANUFACTURER,
+    MAX_CONCURRENT_REQUESTS,
     MODEL,
+    VERIFY_DELAY,
+)
+from .parsers import (
+    _as_float,
+    _extract_statuses,
+    build_parser_index,
+    parse_all_statuses,
+    parse_light,
 )
-from .parsers import parse_all_statuses
 
 _LOGGER = logging.getLogger(__name__)
 
+# Characters of the host replaced by "_" in the device registry id
+_DEVICE_ID_TABLE = str.maketrans(".:", "__")
+
+# Trapezoidal rule factor: half the sum of two watt readings times seconds -> kWh
+_HALF_KWH_PER_WATT_SECOND = 0.5 / 3_600_000.0
+
+# Shared fallback for missing element data: never mutate
+_EMPTY: dict = {}
+
 
 class DomologicaCoordinator(DataUpdateCoordinator):
     """Central data manager for the Domologica controller."""
@@ -36,6 +60,25 @@ class DomologicaCoordinator(DataUpdateCoordinator):
     ) -> None:
         self.entry = entry
         self.element_info: dict[str, dict] = {}
+        self.elements_by_class: dict[str, list[tuple[str, dict]]] = {}
+        self._delios_device_info: dict[str, dict] = {}
+        # Last statuses payload and its parsed form (never handed out)
+        self._last_body: bytes | None = None
+        self._last_parsed: dict[str, dict] = {}
+        self._parser_index: dict = {}
+        # Elements waiting to read back their real state after a command
+        self._verify_pending: set[str] = set()
+        self._verify_cancel = None
+        self._verify_task = None
+        self._verify_eids: set[str] = set()
+        # Energy (kWh) integrated from power readings, see track_energy.
+        # Parallel lists, one slot per tracked reading; energy_kwh holds the
+        # published totals, rounded once per refresh
+        self.energy_kwh: list[float | None] = []
+        self._energy_total: list[float] = []
+        self._energy_sources: list[tuple[str, str, bool]] = []
+        self._energy_last_power: list[float | None] = []
+        self._energy_last_time: list[float] = []
 
         # API client
         self.api_client = DomologicaApiClient(hass, host, username, password)
@@ -51,8 +94,9 @@ class DomologicaCoordinator(DataUpdateCoordinator):
         )
 
         # Unique identifier for the device registry
-        self.device_id = host.replace("http://", "").replace("https://", "").replace(".", "_").replace(":", "_")
-        self.device_name = f"{INTEGRATION_NAME} ({host.replace('http://', '').replace('https://', '')})"
+        bare_host = host.removeprefix("http://").removeprefix("https://")
+        self.device_id = bare_host.translate(_DEVICE_ID_TABLE)
+        self.device_name = f"{INTEGRATION_NAME} ({bare_host})"
 
         super().__init__(
             hass,
@@ -61,9 +105,9 @@ class DomologicaCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=scan_interval),
         )
 
-    @property
+    @cached_property
     def device_info_dict(self) -> dict:
-        """Device information for the main controller."""
+        """Device information for the main controller (built once)."""
         return {
             "identifiers": {(DOMAIN, self.device_id)},
             "name": self.device_name,
@@ -75,13 +119,187 @@ class DomologicaCoordinator(DataUpdateCoordinator):
 
     def delios_device_info_dict(self, eid: str, element_name: str) -> dict:
         """Device information for the Delios inverter (separate device)."""
-        return {
-            "identifiers": {(DOMAIN, f"{self.device_id}_delios_{eid}")},
-            "name": element_name,
-            "manufacturer": "Delios",
-            "model": "Inverter",
-            "via_device": (DOMAIN, self.device_id),
-        }
+        info = self._delios_device_info.get(eid)
+        if info is None:
+            info = self._delios_device_info[eid] = {
+                "identifiers": {(DOMAIN, f"{self.device_id}_delios_{eid}")},
+                "name": element_name,
+                "manufacturer": "Delios",
+                "model": "Inverter",
+                "via_device": (DOMAIN, self.device_id),
+            }
+        return info
+
+    def element(self, eid: str) -> dict:
+        """Current data of eid, or a shared empty dict when unknown."""
+        data = self.data
+        return _EMPTY if data is None else data.get(eid) or _EMPTY
+
+    def verify_signal(self, eid: str) -> str:
+        """Dispatcher signal carrying the real state of eid after a command."""
+        return f"{DOMAIN}_{self.entry.entry_id}_verified_{eid}"
+
+    @callback
+    def request_verify(self, eid: str) -> None:
+        """Reads back the real state of a light shortly after a command.
+
+        Every request restarts the delay, so the lights of a burst (e.g. a
+        scene) are verified together.
+        """
+        self._verify_pending.add(eid)
+        if self._verify_cancel is not None:
+            self._verify_cancel()
+        self._verify_cancel = async_call_later(
+            self.hass, VERIFY_DELAY, self._start_verify
+        )
+
+    @callback
+    def _start_verify(self, _now) -> None:
+        self._verify_cancel = None
+        eids, self._verify_pending = self._verify_pending, set()
+        task = self._verify_task
+        if task is not None and not task.done():
+            # A slower, older read must not dispatch state older than this
+            # burst: cancel it and verify its lights again with the new ones
+            task.cancel()
+            eids |= self._verify_eids
+        self._verify_eids = eids
+        self._verify_task = self.hass.async_create_background_task(
+            self._async_verify(eids), name=f"domologica_verify_{self.device_id}"
+        )
+
+    async def _async_verify(self, eids: set[str]) -> None:
+        """Fetches the given lights and dispatches their real state."""
+        try:
+            if len(eids) <= MAX_CONCURRENT_REQUESTS:
+                # A few lights: small per-element requests, all in flight at
+                # once so that they settle together
+                ordered = list(eids)
+                roots = await asyncio.gather(
+                    *(self.api_client.async_fetch_single_status(e) for e in ordered)
+                )
+                results = {
+                    eid: parse_light(_extract_statuses(root))
+                    for eid, root in zip(ordered, roots)
+                    if root is not None
+                }
+            else:
+                # One request for the whole burst
+                body = await self.api_client.async_fetch_all_statuses()
+                if body is None:
+                    return
+                index = {eid: self._parser_index[eid] for eid in eids}
+                if len(body) > EXECUTOR_PARSE_THRESHOLD:
+                    results = await self.hass.async_add_executor_job(
+                        parse_all_statuses, body, index
+                    )
+                else:
+                    results = parse_all_statuses(body, index)
+        except Exception as err:
+            _LOGGER.error("Error verifying lights %s: %s", ", ".join(eids), err)
+            return
+
+        data = self.data
+        if data is None:
+            return
+        for eid, real in results.items():
+            # A newer command is already waiting: this state may be stale
+            if eid in self._verify_pending or eid not in data:
+                continue
+            self.patch_element(eid, **real)
+            async_dispatcher_send(self.hass, self.verify_signal(eid), real)
+
+    @callback
+    def patch_element(self, eid: str, **values) -> None:
+        """Replaces the entry of eid with an updated copy, without notifying.
+
+        Entries are shared with the cached payload and compared by identity
+        by the entities: they are never mutated in place.
+        """
+        data = self.data
+        if data is not None:
+            data[eid] = {**data.get(eid, _EMPTY), **values}
+
+    @callback
+    def async_set_element_data(self, eid: str, **values) -> None:
+        """Optimistically applies the outcome of a command to one element.
+
+        Listeners are notified with the patched data, without fetching the
+        statuses again; the next poll confirms the real state.
+        """
+        data = self.data
+        if data is None:
+            return
+        self.patch_element(eid, **values)
+        self.async_set_updated_data(data)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending verifications and fetches with the coordinator."""
+        if self._verify_cancel is not None:
+            self._verify_cancel()
+            self._verify_cancel = None
+        if self._verify_task is not None and not self._verify_task.done():
+            self._verify_task.cancel()
+        self.api_client.async_cancel_fetches()
+        await super().async_shutdown()
+
+    def track_energy(self, eid: str, power_key: str, delios: bool = False) -> int:
+        """Integrates the power (W) data[eid][power_key] into energy_kwh.
+
+        Delios readings are {"value", "unit"} dicts. Returns the index of
+        the energy value in energy_kwh, None until the first reading.
+        """
+        self._energy_sources.append((eid, power_key, delios))
+        self.energy_kwh.append(None)
+        self._energy_total.append(0.0)
+        self._energy_last_power.append(None)
+        self._energy_last_time.append(0.0)
+        return len(self._energy_sources) - 1
+
+    def _integrate_energy(self, data: dict) -> None:
+        """Trapezoidal integration of every tracked power reading.
+
+        Runs once per refresh for all the energy sensors, which just read
+        the result.
+        """
+        # Same monotonic clock as time.monotonic(), read from the running loop
+        now = self.hass.loop.time()
+        energy = self.energy_kwh
+        totals = self._energy_total
+        last_powers = self._energy_last_power
+        last_times = self._energy_last_time
+        for i, (eid, power_key, delios) in enumerate(self._energy_sources):
+            values = data.get(eid)
+            if not values:
+                continue
+            power = values.get(power_key)
+            if power is None:
+                continue
+            if delios:
+                # parse_delios already converted the value to float (or None)
+                power = power["value"]
+                if power is None:
+                    continue
+            else:
+                power = _as_float(power)
+                if power is None:
+                    continue
+            power = max(0.0, power)
+
+            last_power = last_powers[i]
+            last_powers[i] = power
+            if last_power is None:
+                # First reading: nothing to integrate yet
+                energy[i] = 0.0
+                last_times[i] = now
+                continue
+            # Both readings are >= 0 and the clock is monotonic
+            totals[i] += (
+                (last_power + power) * (now - last_times[i])
+                * _HALF_KWH_PER_WATT_SECOND
+            )
+            energy[i] = round(totals[i], 3)
+            last_times[i] = now
 
     async def async_setup(self) -> bool:
         """Discover elements from the controller."""
@@ -99,24 +317,29 @@ class DomologicaCoordinator(DataUpdateCoordinator):
             self.entry.data.get("enable_delios", False),
         )
         if not enable_delios:
-            before = len(self.element_info)
-            self.element_info = {
-                eid: info for eid, info in self.element_info.items()
-                if info["class"] != "DeliosMainUnitElement"
-            }
-            skipped = before - len(self.element_info)
+            skipped = [
+                eid for eid, info in self.element_info.items()
+                if info["class"] == "DeliosMainUnitElement"
+            ]
+            for eid in skipped:
+                del self.element_info[eid]
             if skipped:
-                _LOGGER.info("Delios disabled: skipped %s elements", skipped)
+                _LOGGER.info("Delios disabled: skipped %s elements", len(skipped))
 
-        # Apply custom names from onboarding
+        # Apply custom names from onboarding and group elements by class
+        # so each platform only visits its own
         custom_names = self.entry.data.get("custom_names", {})
-        for eid, custom_name in custom_names.items():
-            if eid in self.element_info and custom_name:
+        self.elements_by_class = defaultdict(list)
+        for eid, info in self.element_info.items():
+            custom_name = custom_names.get(eid)
+            if custom_name:
                 _LOGGER.debug(
                     "Custom name for %s: %s -> %s",
-                    eid, self.element_info[eid]["name"], custom_name,
+                    eid, info["name"], custom_name,
                 )
-                self.element_info[eid]["name"] = custom_name
+                info["name"] = custom_name
+            self.elements_by_class[info["class"]].append((eid, info))
+        self._parser_index = build_parser_index(self.element_info)
 
         _LOGGER.info(
             "Discovery completed: %s elements found", len(self.element_info)
@@ -128,9 +351,30 @@ class DomologicaCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> dict:
         """Periodic status retrieval via XML polling."""
-        root = await self.api_client.async_fetch_all_statuses()
+        body = await self.api_client.async_fetch_all_statuses()
 
-        if root is None:
+        if body is None:
             raise UpdateFailed("Error retrieving XML statuses")
 
-        return parse_all_statuses(root, self.element_info)
+        # Nothing changed on the bus: skip parsing the same payload again
+        if body != self._last_body:
+            try:
+                # Keep the event loop responsive on large installations
+                if len(body) > EXECUTOR_PARSE_THRESHOLD:
+                    parsed = await self.hass.async_add_executor_job(
+                        parse_all_statuses, body, self._parser_index
+                    )
+                else:
+                    parsed = parse_all_statuses(body, self._parser_index)
+            except etree.XMLSyntaxError as err:
+                # Never publish (or cache) the statuses of a partial payload
+                raise UpdateFailed(f"Invalid XML in element statuses: {err}") from err
+            self._last_body = body
+            self._last_parsed = parsed
+
+        # Commands replace entries in this mapping (see patch_element): the
+        # entries themselves are shared, so unchanged elements keep their
+        # identity and their entities skip the update
+        data = dict(self._last_parsed)
+        self._integrate_energy(data)
+        return data
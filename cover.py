@@ -11,7 +11,8 @@ from homeassistant.components.cover import (
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, VERIFY_DELAY
+from .parsers import _extract_statuses, parse_cover
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,8 +21,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = [
         DomologicaCover(coordinator, eid, info["name"], coordinator.travel_time)
-        for eid, info in coordinator.element_info.items()
-        if info["class"] == "ShutterElement"
+        for eid, info in coordinator.elements_by_class.get("ShutterElement", ())
     ]
     _LOGGER.info("Loading %s shutters", len(entities))
     async_add_entities(entities)
@@ -41,17 +41,13 @@ class DomologicaCover(CoordinatorEntity, CoverEntity):
             | CoverEntityFeature.CLOSE
             | CoverEntityFeature.STOP
         )
-        self._attr_current_cover_position = 50
+        # Estimated position, kept as a float between reads
+        self._attr_current_cover_position = 50.0
         self._last_tick = None
         self._verify_task = None
-
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_cover"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
+        self._verify_deadline = 0.0
+        self._attr_unique_id = f"domologica_{eid}_cover"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
 
     @property
     def is_closed(self):
@@ -61,90 +57,96 @@ class DomologicaCover(CoordinatorEntity, CoverEntity):
 
     @property
     def current_cover_position(self):
-        if not self.coordinator.data or self._eid not in self.coordinator.data:
+        entry = self._data
+        is_opening = entry.get("is_opening", False)
+        if not is_opening and not entry.get("is_closing", False):
+            # Not moving: nothing to estimate
+            self._last_tick = None
             return int(self._attr_current_cover_position)
 
-        data = self.coordinator.data.get(self._eid, {})
-        is_opening = data.get("is_opening", False)
-        is_closing = data.get("is_closing", False)
-
-        now = time.time()
-        if (is_opening or is_closing) and self._last_tick:
+        now = time.monotonic()
+        if self._last_tick:
             diff = now - self._last_tick
             movement = (diff / max(1, self._travel_time)) * 100
             if is_opening:
                 self._attr_current_cover_position = min(
-                    100, self._attr_current_cover_position + movement
+                    100.0, self._attr_current_cover_position + movement
                 )
             else:
                 self._attr_current_cover_position = max(
-                    0, self._attr_current_cover_position - movement
+                    0.0, self._attr_current_cover_position - movement
                 )
 
-        self._last_tick = now if (is_opening or is_closing) else None
+        self._last_tick = now
         return int(self._attr_current_cover_position)
 
+    @property
+    def _data(self) -> dict:
+        return self.coordinator.element(self._eid)
+
     @property
     def is_opening(self):
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(self._eid, {}).get("is_opening", False)
+        return self._data.get("is_opening", False)
 
     @property
     def is_closing(self):
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(self._eid, {}).get("is_closing", False)
+        return self._data.get("is_closing", False)
 
     async def _verify_and_update(self):
         try:
-            await asyncio.sleep(1.5)
-            root = await self.coordinator.api_client.async_fetch_single_status(self._eid)
-            if root is None:
-                return
-            from .parsers import _extract_statuses, parse_cover
-            statuses = _extract_statuses(root)
-            real = parse_cover(statuses)
-            if self.coordinator.data is not None:
-                if self._eid not in self.coordinator.data:
-                    self.coordinator.data[self._eid] = {}
-                self.coordinator.data[self._eid].update(real)
-                if not real.get("is_opening") and not real.get("is_closing"):
-                    self._last_tick = None
-                self.async_write_ha_state()
+            while True:
+                # Commands sent while waiting push the deadline further
+                remaining = self._verify_deadline - time.monotonic()
+                while remaining > 0:
+                    await asyncio.sleep(remaining)
+                    remaining = self._verify_deadline - time.monotonic()
+                deadline = self._verify_deadline
+
+                root = await self.coordinator.api_client.async_fetch_single_status(self._eid)
+                if root is not None:
+                    statuses = _extract_statuses(root)
+                    real = parse_cover(statuses)
+                    if self.coordinator.data is not None:
+                        self.coordinator.patch_element(self._eid, **real)
+                        if not real.get("is_opening") and not real.get("is_closing"):
+                            self._last_tick = None
+                        self.async_write_ha_state()
+
+                # Verify again only if a command arrived during the fetch
+                if self._verify_deadline == deadline:
+                    return
         except Exception as err:
             _LOGGER.error("Error verifying shutter %s: %s", self._eid, err)
 
     def _start_verify_task(self):
-        if self._verify_task and not self._verify_task.done():
-            self._verify_task.cancel()
-        self._verify_task = self.hass.async_create_task(self._verify_and_update())
+        # One task verifies a whole burst of commands
+        self._verify_deadline = time.monotonic() + VERIFY_DELAY
+        if self._verify_task is None or self._verify_task.done():
+            self._verify_task = self.hass.async_create_task(self._verify_and_update())
 
-    async def async_open_cover(self, **kwargs):
+    def _set_motion(self, opening: bool, closing: bool) -> None:
+        """Optimistically store the commanded motion in the coordinator data."""
         if self.coordinator.data:
-            self.coordinator.data.setdefault(self._eid, {}).update(
-                {"is_opening": True, "is_closing": False}
+            self.coordinator.patch_element(
+                self._eid, is_opening=opening, is_closing=closing
             )
-        self._last_tick = time.time()
+
+    async def async_open_cover(self, **kwargs):
+        self._set_motion(True, False)
+        self._last_tick = time.monotonic()
         self.async_write_ha_state()
         await self.coordinator.api_client.async_cover_command(self._eid, "open")
         self._start_verify_task()
 
     async def async_close_cover(self, **kwargs):
-        if self.coordinator.data:
-            self.coordinator.data.setdefault(self._eid, {}).update(
-                {"is_opening": False, "is_closing": True}
-            )
-        self._last_tick = time.time()
+        self._set_motion(False, True)
+        self._last_tick = time.monotonic()
         self.async_write_ha_state()
         await self.coordinator.api_client.async_cover_command(self._eid, "close")
         self._start_verify_task()
 
     async def async_stop_cover(self, **kwargs):
-        if self.coordinator.data:
-            self.coordinator.data.setdefault(self._eid, {}).update(
-                {"is_opening": False, "is_closing": False}
-            )
+        self._set_motion(False, False)
         self._last_tick = None
         self.async_write_ha_state()
         await self.coordinator.api_client.async_cover_command(self._eid, "stop")
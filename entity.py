@@ -0,0 +1,55 @@
+"""Shared entity helpers for the Domologica UNA Automation integration."""
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ALARM_RE
+
+
+def is_alarm_element(info: dict) -> bool:
+    """Return True if this StatusElement represents a burglar alarm."""
+    return ALARM_RE.search((info.get("name") or "").lower()) is not None
+
+
+class DomologicaElementEntity(CoordinatorEntity):
+    """Entity whose state is derived from the data of one element.
+
+    Subclasses implement _update_state(data), called on creation and
+    whenever the coordinator hands out a different entry for the element.
+    Entries are replaced, never mutated (see patch_element), so an
+    unchanged payload or a command on another element skips the update.
+    """
+
+    # (data key, state attribute) pairs exposed when the value is known,
+    # see _update_extra_attributes
+    _extra_attributes: tuple[tuple[str, str], ...] = ()
+    _extra_sig: tuple | None = None
+
+    def __init__(self, coordinator, eid: str) -> None:
+        super().__init__(coordinator)
+        self._eid = eid
+        self._get = coordinator.element
+        self._last_data = self._get(eid)
+        self._update_state(self._last_data)
+
+    def _update_state(self, data: dict) -> None:
+        raise NotImplementedError
+
+    def _update_extra_attributes(self, data: dict) -> None:
+        """Rebuilds the extra state attributes only when a value changed."""
+        sig = tuple([data.get(key) for key, _ in self._extra_attributes])
+        if sig != self._extra_sig:
+            self._extra_sig = sig
+            self._attr_extra_state_attributes = {
+                attr: value
+                for (_, attr), value in zip(self._extra_attributes, sig)
+                if value is not None
+            }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state when the element data changed."""
+        data = self._get(self._eid)
+        if data is not self._last_data:
+            self._last_data = data
+            self._update_state(data)
+        super()._handle_coordinator_update()
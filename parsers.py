@@ -1,57 +1,82 @@
 """XML parser for Domologica element states."""
 import logging
-import re
-import xml.etree.ElementTree as ET
+import sys
+from collections.abc import Iterator
+from io import BytesIO
 
-_LOGGER = logging.getLogger(__name__)
+from lxml import etree
 
+_LOGGER = logging.getLogger(__name__)
 
-def _extract_statuses(element_status: ET.Element) -> dict:
-    """Extracts all Status tags into a dictionary {id: value_text | None}."""
-    result = {}
-    for status in element_status.findall("Status"):
-        sid = status.get("id")
-        if sid is None:
-            # Status without id attribute (e.g. <Status>isswitchedoff</Status>)
-            sid = (status.text or "").strip()
-            if sid:
-                result[sid] = None
-            continue
-        value_el = status.find("value")
-        result[sid] = value_el.text if value_el is not None else None
+# Compiled paths, resolved once at import
+_XP_ELEMENT_PATH = etree.XPath("./ElementPath/text()", smart_strings=False)
+# Per Status, in document order: its id attribute and the text of its first
+# value, or its own text when it has no id (e.g. <Status>isswitchedoff</Status>)
+_XP_STATUS_PARTS = etree.XPath(
+    "./Status/@id | ./Status[@id]/value[1]/text()[1]"
+    " | ./Status[not(@id)]/text()[1]"
+)
+_TAG_VALUE = "value"
+
+
+def _extract_statuses(
+    element_status: etree._Element, result: dict | None = None
+) -> dict:
+    """Extracts all Status tags into a dictionary {id: value_text | None}.
+
+    Ids are lowercased here, once, so the parsers below look them up with
+    lowercase literals. They are interned: the same few names repeat for
+    every element on every poll. A given result dict is cleared and
+    refilled, so that one dict can serve a whole payload.
+    """
+    intern = sys.intern
+    if result is None:
+        result = {}
+    else:
+        result.clear()
+    sid = None
+    for part in _XP_STATUS_PARTS(element_status):
+        if part.is_attribute:
+            sid = intern(part.lower())
+            result[sid] = None
+        elif part.getparent().tag == _TAG_VALUE:
+            # Plain str: lxml "smart" strings keep their tree alive
+            result[sid] = str(part)
+        else:
+            bare = part.strip()
+            if bare:
+                result[intern(bare.lower())] = None
     return result
 
 
-def _has_status(statuses: dict, *names: str) -> bool:
-    """Checks if at least one of the names is present as a key (case-insensitive)."""
-    lower_keys = {k.lower() for k in statuses}
-    return any(n.lower() in lower_keys for n in names)
-
-
-def _get_status_value(statuses: dict, *names: str) -> str | None:
-    """Searches for a value by name (case-insensitive), returns the first found."""
-    lower_map = {k.lower(): v for k, v in statuses.items()}
-    for name in names:
-        val = lower_map.get(name.lower())
-        if val is not None:
-            return val
-    return None
-
-
-def _safe_float(value: str | None, default: float | None = None) -> float | None:
+def _safe_float(
+    value: str | None, default: float | None = None, _float=float
+) -> float | None:
     if value is None:
         return default
     try:
-        return float(value)
+        return _float(value)
     except (ValueError, TypeError):
         return default
 
 
-def _safe_int(value: str | None, default: int | None = None) -> int | None:
+_NUMBER = (int, float)
+
+
+def _as_float(value) -> float | None:
+    """float(value), skipping the try/except when value is already a number."""
+    if isinstance(value, _NUMBER):
+        return float(value)
+    return _safe_float(value)
+
+
+def _safe_int(
+    value: str | None, default: int | None = None, _int=int, _float=float
+) -> int | None:
     if value is None:
         return default
     try:
-        return int(float(value))
+        return _int(_float(value))
     except (ValueError, TypeError):
         return default
 
@@ -60,8 +85,8 @@ def _safe_int(value: str | None, default: int | None = None) -> int | None:
 
 
 def parse_light(statuses: dict) -> dict:
-    is_on = _has_status(statuses, "isswitchedon")
-    brightness = _get_status_value(statuses, "getdimmer")
+    is_on = "isswitchedon" in statuses
+    brightness = statuses.get("getdimmer")
     return {
         "is_on": is_on,
         "brightness": _safe_int(brightness),
@@ -70,36 +95,36 @@ def parse_light(statuses: dict) -> dict:
 
 def parse_cover(statuses: dict) -> dict:
     return {
-        "is_opening": _has_status(statuses, "isgoingup"),
-        "is_closing": _has_status(statuses, "isgoingdown"),
+        "is_opening": "isgoingup" in statuses,
+        "is_closing": "isgoingdown" in statuses,
     }
 
 
 def parse_ta_sensor(statuses: dict) -> dict:
-    power = _get_status_value(statuses, "TA Value")
+    power = statuses.get("ta value")
     return {
         "power": _safe_float(power),
     }
 
 
 def parse_thermostat(statuses: dict) -> dict:
-    temperature_raw = _get_status_value(statuses, "temperature")
+    temperature_raw = statuses.get("temperature")
     temperature = _safe_float(temperature_raw)
     if temperature is not None and temperature > 100:
         temperature = temperature / 10.0  # Normalize if value > 100
 
-    t_min = _safe_float(_get_status_value(statuses, "tMin"))
-    t_max = _safe_float(_get_status_value(statuses, "tMax"))
-    speed = _safe_int(_get_status_value(statuses, "speed"))
-    season = _get_status_value(statuses, "season") or "Winter"
-    t_mode = _get_status_value(statuses, "tMode") or "Off"
-    delta_t = _safe_float(_get_status_value(statuses, "deltat"))
-    calibration = _safe_float(_get_status_value(statuses, "calibration"))
-    defrost = _safe_float(_get_status_value(statuses, "defrost"))
-    reactivity = _safe_int(_get_status_value(statuses, "reactivity"))
+    t_min = _safe_float(statuses.get("tmin"))
+    t_max = _safe_float(statuses.get("tmax"))
+    speed = _safe_int(statuses.get("speed"))
+    season = statuses.get("season") or "Winter"
+    t_mode = statuses.get("tmode") or "Off"
+    delta_t = _safe_float(statuses.get("deltat"))
+    calibration = _safe_float(statuses.get("calibration"))
+    defrost = _safe_float(statuses.get("defrost"))
+    reactivity = _safe_int(statuses.get("reactivity"))
 
-    zone_active_winter = _has_status(statuses, "zoneactive")
-    zone_active_summer = _has_status(statuses, "zoneactivesummer")
+    zone_active_winter = "zoneactive" in statuses
+    zone_active_summer = "zoneactivesummer" in statuses
 
     return {
         "temperature": temperature,
@@ -119,37 +144,37 @@ def parse_thermostat(statuses: dict) -> dict:
 
 def parse_samsung_ac(statuses: dict) -> dict:
     current_temp = _safe_float(
-        _get_status_value(statuses, "Get AC unit Temperature Room")
+        statuses.get("get ac unit temperature room")
     )
     target_temp = _safe_float(
-        _get_status_value(statuses, "Get AC unit Temperature Setted")
+        statuses.get("get ac unit temperature setted")
     )
     error_code = _safe_int(
-        _get_status_value(statuses, "Get AC unit Error Code")
+        statuses.get("get ac unit error code")
     )
-    speed = _safe_int(_get_status_value(statuses, "speed"))
-    delta_t = _safe_float(_get_status_value(statuses, "deltat"))
+    speed = _safe_int(statuses.get("speed"))
+    delta_t = _safe_float(statuses.get("deltat"))
 
-    is_on = not _has_status(statuses, "IsSwitchedOff")
-    is_connected = _has_status(statuses, "IsConnected")
+    is_on = "isswitchedoff" not in statuses
+    is_connected = "isconnected" in statuses
 
     # Determine mode from flags
     mode = "off"
     if is_on:
-        if _has_status(statuses, "Get AC unit Mode is Heat"):
+        if "get ac unit mode is heat" in statuses:
             mode = "heat"
-        elif _has_status(statuses, "Get AC unit Mode is Cool"):
+        elif "get ac unit mode is cool" in statuses:
             mode = "cool"
-        elif _has_status(statuses, "Get AC unit Mode is Auto"):
+        elif "get ac unit mode is auto" in statuses:
             mode = "auto"
-        elif _has_status(statuses, "Get AC unit Mode is Dry"):
+        elif "get ac unit mode is dry" in statuses:
             mode = "dry"
-        elif _has_status(statuses, "Get AC unit Mode is Fan"):
+        elif "get ac unit mode is fan" in statuses:
             mode = "fan_only"
 
     # Fallback: parse from parameter field if available
     if current_temp is None or target_temp is None:
-        param = _get_status_value(statuses, "parameter")
+        param = statuses.get("parameter")
         if param:
             parsed = _parse_parameter_string(param)
             if current_temp is None:
@@ -175,29 +200,29 @@ def parse_samsung_ac(statuses: dict) -> dict:
 
 def parse_samsung_water(statuses: dict) -> dict:
     h2o_measured = _safe_float(
-        _get_status_value(statuses, "Get AC unit H2O Temperature Measured")
+        statuses.get("get ac unit h2o temperature measured")
     )
     h2o_setted = _safe_float(
-        _get_status_value(statuses, "Get AC unit H2O Temperature Setted")
+        statuses.get("get ac unit h2o temperature setted")
     )
     h2o_mode = _safe_int(
-        _get_status_value(statuses, "Get AC unit H2O Mode")
+        statuses.get("get ac unit h2o mode")
     )
     h2o_operation = _safe_int(
-        _get_status_value(statuses, "Get AC unit H2O Operation")
+        statuses.get("get ac unit h2o operation")
     )
     water_in = _safe_float(
-        _get_status_value(statuses, "Get AC unit Water In Temperature")
+        statuses.get("get ac unit water in temperature")
     )
     water_out = _safe_float(
-        _get_status_value(statuses, "Get AC unit Water Out Temperature")
+        statuses.get("get ac unit water out temperature")
     )
     error_code = _safe_int(
-        _get_status_value(statuses, "Get AC unit Error Code")
+        statuses.get("get ac unit error code")
     )
-    is_on = _has_status(statuses, "isswitchedon")
-    is_connected = _has_status(statuses, "IsConnected")
-    is_heating = _has_status(statuses, "Get AC unit Mode is Heat")
+    is_on = "isswitchedon" in statuses
+    is_connected = "isconnected" in statuses
+    is_heating = "get ac unit mode is heat" in statuses
 
     return {
         "is_on": is_on,
@@ -218,7 +243,7 @@ def parse_delios(statuses: dict) -> dict:
 
     Format: "Delios InverterV (Input Volt Phase R)=225;...;Delios Inverter (Inverter Status)=0"
     """
-    param = _get_status_value(statuses, "parameter")
+    param = statuses.get("parameter")
     if not param:
         return {}
 
@@ -253,14 +278,14 @@ def parse_delios(statuses: dict) -> dict:
     }
 
     for pair in param.split(";"):
-        pair = pair.strip()
-        if "=" not in pair:
+        raw_name, sep, raw_value = pair.strip().partition("=")
+        if not sep:
             continue
-        raw_name, raw_value = pair.split("=", 1)
         # Extract the name between parentheses
-        match = re.search(r"\((.+?)\)", raw_name)
-        if match:
-            name = match.group(1)
+        lp = raw_name.find("(")
+        rp = raw_name.find(")", lp + 2) if lp != -1 else -1
+        if rp != -1:
+            name = raw_name[lp + 1:rp]
         else:
             # No parentheses, use the name after "Delios Inverter"
             name = raw_name.replace("Delios Inverter", "").strip()
@@ -278,10 +303,10 @@ def parse_delios(statuses: dict) -> dict:
 
 
 def parse_power_management(statuses: dict) -> dict:
-    current_power = _safe_float(_get_status_value(statuses, "pwmValue"))
-    max_power = _safe_float(_get_status_value(statuses, "MaxWattCalculatedValue"))
-    is_running = _has_status(statuses, "IsRun")
-    is_normal = _has_status(statuses, "NormalMeasure")
+    current_power = _safe_float(statuses.get("pwmvalue"))
+    max_power = _safe_float(statuses.get("maxwattcalculatedvalue"))
+    is_running = "isrun" in statuses
+    is_normal = "normalmeasure" in statuses
 
     return {
         "current_power": current_power,
@@ -292,12 +317,12 @@ def parse_power_management(statuses: dict) -> dict:
 
 
 def parse_status_element(statuses: dict) -> dict:
-    is_on = _has_status(statuses, "statuson")
+    is_on = "statuson" in statuses
     return {"is_on": is_on}
 
 
 def parse_switch_element(statuses: dict) -> dict:
-    is_released = _has_status(statuses, "released")
+    is_released = "released" in statuses
     return {"released": is_released}
 
 
@@ -312,14 +337,9 @@ def _parse_parameter_string(param: str) -> dict:
     """Generic parameter field parsing (format 'name:value:unit;...')."""
     result = {}
     for part in param.split(";"):
-        part = part.strip()
-        if not part:
-            continue
-        segments = part.split(":")
-        if len(segments) >= 2:
-            name = segments[0].strip()
-            value = segments[1].strip()
-            result[name] = value
+        name, sep, rest = part.partition(":")
+        if sep:
+            result[name.strip()] = rest.partition(":")[0].strip()
     return result
 
 
@@ -341,40 +361,69 @@ PARSER_MAP = {
 }
 
 
-def parse_all_statuses(
-    root: ET.Element, element_info: dict[str, dict]
-) -> dict[str, dict]:
-    """Global parsing of element_xml_statuses.xml."""
+def iter_element_statuses(body: bytes) -> Iterator[etree._Element]:
+    """Streams the <ElementStatus> nodes of element_xml_statuses.xml.
+
+    Each node is cleared (together with its already processed siblings)
+    as soon as the consumer moves on, so the full tree is never held
+    in memory. A malformed or truncated payload raises
+    etree.XMLSyntaxError instead of yielding partial statuses.
+    """
+    for _, el in etree.iterparse(
+        BytesIO(body),
+        events=("end",),
+        tag="ElementStatus",
+        resolve_entities=False,
+        no_network=True,
+    ):
+        yield el
+        el.clear()
+        while el.getprevious() is not None:
+            del el.getparent()[0]
+
+
+def build_parser_index(element_info: dict[str, dict]) -> dict:
+    """Maps each element id to its parser, skipping classes without one."""
+    return {
+        eid: parser
+        for eid, info in element_info.items()
+        if (parser := PARSER_MAP.get(info.get("class", ""))) is not None
+    }
+
+
+def parse_all_statuses(body: bytes, parser_index: dict) -> dict[str, dict]:
+    """Global parsing of the raw element_xml_statuses.xml payload.
+
+    parser_index comes from build_parser_index: one lookup per element.
+    """
     results = {}
-    if root is None:
+    if not body:
         return results
 
-    for el_status in root.findall(".//ElementStatus"):
-        path_el = el_status.find("ElementPath")
-        if path_el is None or not path_el.text:
+    parser_get = parser_index.get
+    # Parsers only read the statuses and return their own dict: one buffer
+    # is reused for every element of the payload
+    statuses: dict = {}
+    for el_status in iter_element_statuses(body):
+        paths = _XP_ELEMENT_PATH(el_status)
+        if not paths:
             continue
 
-        eid = path_el.text.strip()
-
-        # Determine element class
-        info = element_info.get(eid)
-        if not info:
-            continue
+        eid = paths[0].strip()
 
-        eclass = info.get("class", "")
-        parser = PARSER_MAP.get(eclass)
-        if not parser:
+        parser = parser_get(eid)
+        if parser is None:
             continue
 
-        # Extract all statuses
-        statuses = _extract_statuses(el_status)
+        # Extract statuses only for elements that have a parser
+        _extract_statuses(el_status, statuses)
 
         # Apply the specific parser
         try:
             results[eid] = parser(statuses)
         except Exception as err:
             _LOGGER.error(
-                "Error parsing element %s (%s): %s", eid, eclass, err
+                "Error parsing element %s (%s): %s", eid, parser.__name__, err
             )
 
     return results
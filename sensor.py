@@ -4,7 +4,7 @@ Handles: TASensorElement, DeliosMainUnitElement, PowerMenagementElement (sensors
 Includes energy sensors (kWh) computed via Riemann sum integration.
 """
 import logging
-import time
+from types import new_class
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -20,11 +20,12 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfTemperature,
 )
-from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import DomologicaElementEntity
+from .parsers import _as_float
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,63 +55,58 @@ DELIOS_SENSORS = {
 }
 
 # Delios power metrics for which to create energy (kWh) sensors
-DELIOS_POWER_KEYS = {"grid_power_in", "grid_power_out", "pv1_power", "pv2_power"}
+DELIOS_POWER_KEYS = frozenset(
+    {"grid_power_in", "grid_power_out", "pv1_power", "pv2_power"}
+)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = []
 
-    for eid, info in coordinator.element_info.items():
-        eclass = info["class"]
-
-        if eclass == "TASensorElement":
-            # Power sensor (W)
-            entities.append(DomologicaPowerSensor(coordinator, eid, info["name"]))
-            # Energy sensor (kWh) derived via integration
-            entities.append(
-                DomologicaEnergySensor(coordinator, eid, info["name"], "power")
-            )
-
-        elif eclass == "DeliosMainUnitElement":
-            for key, (name, dev_class, unit, state_class) in DELIOS_SENSORS.items():
-                entities.append(
-                    DomologicaDeliosSensor(
-                        coordinator, eid, info["name"], key, name,
-                        dev_class, unit, state_class,
-                    )
-                )
-            # Energy sensors (kWh) for Delios power metrics
-            for power_key in DELIOS_POWER_KEYS:
-                power_name = DELIOS_SENSORS[power_key][0]
+    by_class = coordinator.elements_by_class
+
+    for eid, info in by_class.get("TASensorElement", ()):
+        # Power sensor (W)
+        entities.append(DomologicaPowerSensor(coordinator, eid, info["name"]))
+        # Energy sensor (kWh) derived via integration
+        entities.append(
+            DomologicaEnergySensor(coordinator, eid, info["name"], "power")
+        )
+
+    for eid, info in by_class.get("DeliosMainUnitElement", ()):
+        parent_name = info["name"]
+        for key, sensor_cls, name, energy_name in _DELIOS_SENSOR_SPECS:
+            entities.append(sensor_cls(coordinator, eid, parent_name, name))
+            # Energy sensor (kWh) for Delios power metrics
+            if energy_name is not None:
                 entities.append(
                     DomologicaDeliosEnergySensor(
-                        coordinator, eid, info["name"],
-                        power_key, f"{power_name} Energy",
+                        coordinator, eid, parent_name, key, energy_name
                     )
                 )
 
-        elif eclass == "PowerMenagementElement":
-            entities.append(
-                DomologicaPowerMgmtSensor(
-                    coordinator, eid, info["name"], "current_power",
-                    "Current Consumption", SensorDeviceClass.POWER,
-                    UnitOfPower.WATT, SensorStateClass.MEASUREMENT,
-                )
+    for eid, info in by_class.get("PowerMenagementElement", ()):
+        entities.append(
+            DomologicaPowerMgmtSensor(
+                coordinator, eid, info["name"], "current_power",
+                "Current Consumption", SensorDeviceClass.POWER,
+                UnitOfPower.WATT, SensorStateClass.MEASUREMENT,
             )
-            entities.append(
-                DomologicaPowerMgmtSensor(
-                    coordinator, eid, info["name"], "max_power",
-                    "Maximum Threshold", SensorDeviceClass.POWER,
-                    UnitOfPower.WATT, SensorStateClass.MEASUREMENT,
-                )
+        )
+        entities.append(
+            DomologicaPowerMgmtSensor(
+                coordinator, eid, info["name"], "max_power",
+                "Maximum Threshold", SensorDeviceClass.POWER,
+                UnitOfPower.WATT, SensorStateClass.MEASUREMENT,
             )
-            # Energy sensor (kWh) for current consumption
-            entities.append(
-                DomologicaEnergySensor(
-                    coordinator, eid, f"{info['name']} Consumption", "current_power"
-                )
+        )
+        # Energy sensor (kWh) for current consumption
+        entities.append(
+            DomologicaEnergySensor(
+                coordinator, eid, f"{info['name']} Consumption", "current_power"
             )
+        )
 
     _LOGGER.info("Loading %s sensors", len(entities))
     async_add_entities(entities)
@@ -119,34 +115,20 @@ async def async_setup_entry(hass, entry, async_add_entities):
 # -- Power Sensor (TASensorElement) ----------------------------
 
 
-class DomologicaPowerSensor(CoordinatorEntity, SensorEntity):
+class DomologicaPowerSensor(DomologicaElementEntity, SensorEntity):
     """Power sensor (TASensorElement)."""
 
     def __init__(self, coordinator, eid, name):
-        super().__init__(coordinator)
-        self._eid = eid
+        super().__init__(coordinator, eid)
         self._attr_name = name
         self._attr_device_class = SensorDeviceClass.POWER
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = UnitOfPower.WATT
+        self._attr_unique_id = f"domologica_{eid}_power"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
 
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_power"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
-
-    @property
-    def native_value(self):
-        data = (self.coordinator.data or {}).get(self._eid)
-        if data and data.get("power") is not None:
-            try:
-                return float(data["power"])
-            except (ValueError, TypeError):
-                return None
-        return None
+    def _update_state(self, data: dict) -> None:
+        self._attr_native_value = _as_float(data.get("power"))
 
 
 # -- Energy Sensor (kWh) - Riemann Integration ----------------
@@ -155,7 +137,7 @@ class DomologicaPowerSensor(CoordinatorEntity, SensorEntity):
 class DomologicaEnergySensor(CoordinatorEntity, SensorEntity):
     """Energy sensor (kWh) computed by integrating power (W) over time.
 
-    Uses the trapezoidal rule to integrate power readings over time.
+    The coordinator integrates the power readings with the trapezoidal rule.
     The value is cumulative and increasing (TOTAL_INCREASING): HA handles
     resets on restart automatically via the statistics engine.
     """
@@ -167,104 +149,43 @@ class DomologicaEnergySensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, eid, name, power_key):
         super().__init__(coordinator)
         self._eid = eid
-        self._power_key = power_key
         self._attr_name = f"{name} Energy"
-        self._cumulative_energy: float = 0.0
-        self._last_power: float | None = None
-        self._last_update: float | None = None
-
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_energy_{self._power_key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
+        self._energy_index = coordinator.track_energy(eid, power_key)
+        self._attr_unique_id = f"domologica_{eid}_energy_{power_key}"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
 
     @property
     def native_value(self):
-        if self._last_update is None:
-            return None
-        return round(self._cumulative_energy, 3)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Integrate power over time on each coordinator update."""
-        self._update_energy()
-        super()._handle_coordinator_update()
-
-    def _update_energy(self):
-        """Incremental energy calculation via trapezoidal rule."""
-        data = (self.coordinator.data or {}).get(self._eid)
-        if not data:
-            return
-
-        current_power = data.get(self._power_key)
-        if current_power is None:
-            return
-
-        try:
-            current_power = max(0.0, float(current_power))
-        except (ValueError, TypeError):
-            return
-
-        now = time.monotonic()
-
-        if self._last_power is not None and self._last_update is not None:
-            time_delta_hours = (now - self._last_update) / 3600.0
-            # Trapezoidal rule: average of two readings x time
-            avg_power = (self._last_power + current_power) / 2.0
-            energy_kwh = (avg_power * time_delta_hours) / 1000.0
-            if energy_kwh > 0:
-                self._cumulative_energy += energy_kwh
-
-        self._last_power = current_power
-        self._last_update = now
+        return self.coordinator.energy_kwh[self._energy_index]
 
 
 # -- Delios Inverter Sensors (separate device) -----------------
 
 
-class DomologicaDeliosSensor(CoordinatorEntity, SensorEntity):
+class DomologicaDeliosSensor(DomologicaElementEntity, SensorEntity):
     """Individual Delios inverter sensor (from parameter string).
 
     All Delios sensors are grouped under a separate "Delios Inverter"
-    device in the Home Assistant device registry.
+    device in the Home Assistant device registry. Each metric has its own
+    subclass (see _DELIOS_SENSOR_SPECS) holding the key, device class,
+    unit and state class.
     """
 
-    def __init__(
-        self, coordinator, eid, parent_name, metric_key, metric_name,
-        device_class, unit, state_class,
-    ):
-        super().__init__(coordinator)
-        self._eid = eid
-        self._parent_name = parent_name
-        self._metric_key = metric_key
-        self._attr_name = f"{parent_name} {metric_name}"
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._attr_native_unit_of_measurement = unit
-
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_delios_{self._metric_key}"
+    _metric_key: str
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Separate device for the Delios inverter."""
-        return DeviceInfo(**self.coordinator.delios_device_info_dict(
-            self._eid, self._parent_name
-        ))
+    def __init__(self, coordinator, eid, parent_name, metric_name):
+        super().__init__(coordinator, eid)
+        self._attr_name = f"{parent_name} {metric_name}"
+        # Separate device for the Delios inverter
+        self._attr_unique_id = f"domologica_{eid}_delios_{self._metric_key}"
+        self._attr_device_info = DeviceInfo(
+            **coordinator.delios_device_info_dict(eid, parent_name)
+        )
 
-    @property
-    def native_value(self):
-        data = (self.coordinator.data or {}).get(self._eid)
-        if not data or not isinstance(data, dict):
-            return None
+    def _update_state(self, data: dict) -> None:
         metric = data.get(self._metric_key)
-        if isinstance(metric, dict):
-            return metric.get("value")
-        return None
+        # {"value", "unit"} from parse_delios, value already a float
+        self._attr_native_value = metric["value"] if metric else None
 
 
 class DomologicaDeliosEnergySensor(CoordinatorEntity, SensorEntity):
@@ -281,100 +202,65 @@ class DomologicaDeliosEnergySensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, eid, parent_name, power_key, metric_name):
         super().__init__(coordinator)
         self._eid = eid
-        self._parent_name = parent_name
-        self._power_key = power_key
         self._attr_name = f"{parent_name} {metric_name}"
-        self._cumulative_energy: float = 0.0
-        self._last_power: float | None = None
-        self._last_update: float | None = None
-
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_delios_energy_{self._power_key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Separate device for the Delios inverter."""
-        return DeviceInfo(**self.coordinator.delios_device_info_dict(
-            self._eid, self._parent_name
-        ))
+        self._energy_index = coordinator.track_energy(eid, power_key, delios=True)
+        # Separate device for the Delios inverter
+        self._attr_unique_id = f"domologica_{eid}_delios_energy_{power_key}"
+        self._attr_device_info = DeviceInfo(
+            **coordinator.delios_device_info_dict(eid, parent_name)
+        )
 
     @property
     def native_value(self):
-        if self._last_update is None:
-            return None
-        return round(self._cumulative_energy, 3)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Integrate Delios power over time."""
-        self._update_energy()
-        super()._handle_coordinator_update()
-
-    def _update_energy(self):
-        """Incremental energy calculation via trapezoidal rule."""
-        data = (self.coordinator.data or {}).get(self._eid)
-        if not data or not isinstance(data, dict):
-            return
-
-        # Delios data is a dict with "value" key
-        metric = data.get(self._power_key)
-        if not isinstance(metric, dict):
-            return
-        raw_value = metric.get("value")
-        if raw_value is None:
-            return
-
-        try:
-            current_power = max(0.0, float(raw_value))
-        except (ValueError, TypeError):
-            return
-
-        now = time.monotonic()
-
-        if self._last_power is not None and self._last_update is not None:
-            time_delta_hours = (now - self._last_update) / 3600.0
-            avg_power = (self._last_power + current_power) / 2.0
-            energy_kwh = (avg_power * time_delta_hours) / 1000.0
-            if energy_kwh > 0:
-                self._cumulative_energy += energy_kwh
-
-        self._last_power = current_power
-        self._last_update = now
+        return self.coordinator.energy_kwh[self._energy_index]
 
 
 # -- Power Management Sensor -----------------------------------
 
 
-class DomologicaPowerMgmtSensor(CoordinatorEntity, SensorEntity):
+class DomologicaPowerMgmtSensor(DomologicaElementEntity, SensorEntity):
     """Power Management sensor (consumption and threshold)."""
 
     def __init__(
         self, coordinator, eid, parent_name, data_key, suffix_name,
         device_class, unit, state_class,
     ):
-        super().__init__(coordinator)
-        self._eid = eid
+        # Read by _update_state, called from the base __init__
         self._data_key = data_key
+        super().__init__(coordinator, eid)
         self._attr_name = f"{parent_name} {suffix_name}"
         self._attr_device_class = device_class
         self._attr_state_class = state_class
         self._attr_native_unit_of_measurement = unit
-
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_pwrmgmt_{self._data_key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
-
-    @property
-    def native_value(self):
-        data = (self.coordinator.data or {}).get(self._eid)
-        if data and data.get(self._data_key) is not None:
-            try:
-                return float(data[self._data_key])
-            except (ValueError, TypeError):
-                return None
-        return None
+        self._attr_unique_id = f"domologica_{eid}_pwrmgmt_{data_key}"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
+
+    def _update_state(self, data: dict) -> None:
+        self._attr_native_value = _as_float(data.get(self._data_key))
+
+
+def _delios_sensor_class(key, device_class, unit, state_class) -> type:
+    """DomologicaDeliosSensor subclass holding the metadata of one metric."""
+    return new_class(
+        f"DomologicaDeliosSensor_{key}",
+        (DomologicaDeliosSensor,),
+        exec_body=lambda ns: ns.update(
+            _metric_key=key,
+            _attr_device_class=device_class,
+            _attr_native_unit_of_measurement=unit,
+            _attr_state_class=state_class,
+        ),
+    )
+
+
+# Per Delios metric, resolved once at import: (key, sensor class, name,
+# name of its energy sensor or None when the metric is not a power)
+_DELIOS_SENSOR_SPECS = tuple(
+    (
+        key,
+        _delios_sensor_class(key, device_class, unit, state_class),
+        name,
+        f"{name} Energy" if key in DELIOS_POWER_KEYS else None,
+    )
+    for key, (name, device_class, unit, state_class) in DELIOS_SENSORS.items()
+)
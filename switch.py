@@ -6,9 +6,9 @@ import logging
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import DomologicaElementEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,55 +17,39 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = [
         DomologicaPowerSwitch(coordinator, eid, info)
-        for eid, info in coordinator.element_info.items()
-        if info["class"] == "PowerMenagementElement"
+        for eid, info in coordinator.elements_by_class.get(
+            "PowerMenagementElement", ()
+        )
     ]
     _LOGGER.info("Loading %s switch entities", len(entities))
     async_add_entities(entities)
 
 
-class DomologicaPowerSwitch(CoordinatorEntity, SwitchEntity):
+class DomologicaPowerSwitch(DomologicaElementEntity, SwitchEntity):
     """Switch for load management start/stop (PowerMenagementElement)."""
 
     _attr_device_class = SwitchDeviceClass.SWITCH
+    _extra_attributes = (
+        ("current_power", "current_power_w"),
+        ("max_power", "max_power_w"),
+        ("is_normal", "normal_measure"),
+    )
 
     def __init__(self, coordinator, eid, info):
-        super().__init__(coordinator)
-        self._eid = eid
+        super().__init__(coordinator, eid)
         self._attr_name = info["name"]
         self._attr_icon = "mdi:flash-auto"
+        self._attr_unique_id = f"domologica_{eid}_switch"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info_dict)
 
-    @property
-    def unique_id(self):
-        return f"domologica_{self._eid}_switch"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(**self.coordinator.device_info_dict)
-
-    @property
-    def is_on(self) -> bool:
-        data = (self.coordinator.data or {}).get(self._eid)
-        if data:
-            return data.get("is_running", False)
-        return False
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        data = (self.coordinator.data or {}).get(self._eid, {})
-        attrs = {}
-        if data.get("current_power") is not None:
-            attrs["current_power_w"] = data["current_power"]
-        if data.get("max_power") is not None:
-            attrs["max_power_w"] = data["max_power"]
-        if data.get("is_normal") is not None:
-            attrs["normal_measure"] = data["is_normal"]
-        return attrs
+    def _update_state(self, data: dict) -> None:
+        self._attr_is_on = data.get("is_running", False)
+        self._update_extra_attributes(data)
 
     async def async_turn_on(self, **kwargs) -> None:
-        await self.coordinator.api_client.async_switch_command(self._eid, True)
-        await self.coordinator.async_request_refresh()
+        if await self.coordinator.api_client.async_switch_command(self._eid, True):
+            self.coordinator.async_set_element_data(self._eid, is_running=True)
 
     async def async_turn_off(self, **kwargs) -> None:
-        await self.coordinator.api_client.async_switch_command(self._eid, False)
-        await self.coordinator.async_request_refresh()
+        if await self.coordinator.api_client.async_switch_command(self._eid, False):
+            self.coordinator.async_set_element_data(self._eid, is_running=False)